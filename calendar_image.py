@@ -0,0 +1,209 @@
+"""
+Calendar image rendering for the Lunar Report App
+"""
+
+import pandas as pd
+import numpy as np
+import io
+import platform
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _load_fonts():
+    """
+    Load the calendar fonts once per process
+    Returns dict of font id -> PIL font
+    """
+    from PIL import ImageFont
+    
+    # Try to load fonts, fall back to default if not available
+    try:
+        # Use different paths based on OS
+        if platform.system() == 'Windows':
+            font_path = "C:/Windows/Fonts/arial.ttf"
+        else:
+            # Try common Linux/Mac paths
+            font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+        
+        title_font = ImageFont.truetype(font_path, 32)
+        header_font = ImageFont.truetype(font_path, 25)
+        day_font = ImageFont.truetype(font_path, 18)
+        small_font = ImageFont.truetype(font_path, 15)
+        tiny_font = ImageFont.truetype(font_path, 13)
+    except:
+        # Fallback to default font
+        title_font = ImageFont.load_default()
+        header_font = ImageFont.load_default()
+        day_font = ImageFont.load_default()
+        small_font = ImageFont.load_default()
+        tiny_font = ImageFont.load_default()
+    
+    return {
+        'title': title_font,
+        'header': header_font,
+        'day': day_font,
+        'small': small_font,
+        'tiny': tiny_font
+    }
+
+
+@lru_cache(maxsize=512)
+def _measure_text(text, font_id):
+    """
+    Measure text in one of the calendar fonts
+    Returns (width, height) in pixels
+    """
+    font = _load_fonts()[font_id]
+    try:
+        bbox = font.getbbox(text)
+        return bbox[2] - bbox[0], bbox[3] - bbox[1]
+    except Exception:
+        # Conservative fallback
+        return max(0, len(text) * 8), 14
+
+
+def generate_calendar_image(report_data):
+    """
+    Generate a calendar image showing 30 days of lunar data
+    Returns PNG-encoded image bytes
+    """
+    # Imported here so PIL is only loaded when a calendar is actually drawn
+    from PIL import Image, ImageDraw
+    
+    # Constants
+    cell_width = 150
+    cell_height = 180
+    header_height = 60
+    title_height = 80
+    padding = 20
+    calendar_width = 7 * cell_width + 2 * padding
+    # Get the weekday of the first date (0=Sunday, 1=Monday, ..., 6=Saturday)
+    # Python weekday(): Monday=0, Tuesday=1, ..., Sunday=6
+    # Convert to Sunday=0, Monday=1, ..., Saturday=6
+    if len(report_data) > 0:
+        first_date = report_data.iloc[0]['Date']
+        first_weekday = (first_date.weekday() + 1) % 7
+    else:
+        first_weekday = 0
+    
+    # Calculate number of rows needed (30 days, starting from any day of week)
+    num_days = len(report_data) if len(report_data) > 0 else 30
+    # Calculate rows: last day position is first_weekday + (num_days - 1)
+    num_rows = ((first_weekday + num_days - 1) // 7) + 1
+    calendar_height = title_height + header_height + num_rows * cell_height + 2 * padding
+    
+    # Create image with white background
+    img = Image.new('RGB', (calendar_width, calendar_height), color='white')
+    draw = ImageDraw.Draw(img)
+    
+    fonts = _load_fonts()
+    title_font = fonts['title']
+    header_font = fonts['header']
+    day_font = fonts['day']
+    small_font = fonts['small']
+    tiny_font = fonts['tiny']
+    
+    # Draw title
+    title_text = f"30-Day Lunar Calendar"
+    if len(report_data) > 0:
+        start_date = report_data.iloc[0]['Date'].strftime('%B %d')
+        end_date = report_data.iloc[-1]['Date'].strftime('%B %d, %Y')
+        title_text = f"30-Day Lunar Calendar: {start_date} - {end_date}"
+    
+    # Get text bounding box for centering
+    text_width = _measure_text(title_text, 'title')[0]
+    title_x = (calendar_width - text_width) // 2
+    draw.text((title_x, padding), title_text, fill='#1f3a5f', font=title_font)
+    
+    # Draw week headers
+    week_days = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat']
+    for i, day in enumerate(week_days):
+        x = padding + i * cell_width
+        y = title_height + padding
+        draw.rectangle([x, y, x + cell_width, y + header_height], 
+                      fill='#4A90E2', outline='#1f3a5f', width=2)
+        # Center text
+        text_width = _measure_text(day, 'header')[0]
+        text_x = x + (cell_width - text_width) // 2
+        draw.text((text_x, y + 15), day, fill='white', font=header_font)
+    
+    # Pull each field out as a plain array once so the cell loop only indexes
+    dates = report_data['Date'].tolist()
+    phases = report_data['Phase'].to_numpy()
+    illuminations = report_data['Illumination_%'].to_numpy()
+    rise_times = report_data['Moon_Rise'].to_numpy()
+    set_times = report_data['Moon_Set'].to_numpy()
+    supermoons = report_data['Supermoon'].to_numpy()
+    eclipse_types = report_data['Eclipse_Type'].to_numpy()
+    
+    # Cell background color based on phase, looked up for every cell at once
+    bg_colors = np.select(
+        [phases == 'Full Moon', phases == 'New Moon',
+         report_data['Phase'].str.contains('Waxing').to_numpy()],
+        ['#FFE4B5', '#E6E6FA', '#FFF8DC'],
+        default='#F0F0F0'
+    )
+    
+    # Draw calendar cells
+    for idx in range(len(report_data)):
+        # Calculate grid position with correct day-of-week alignment
+        # col_idx starts at first_weekday and wraps around
+        col_idx = (first_weekday + idx) % 7
+        # row_idx accounts for the offset from the start
+        row_idx = (first_weekday + idx) // 7
+        
+        x = padding + col_idx * cell_width
+        y = title_height + padding + header_height + row_idx * cell_height
+        
+        phase = phases[idx]
+        bg_color = bg_colors[idx]
+        
+        draw.rectangle([x, y, x + cell_width - 2, y + cell_height - 2], 
+                      fill=bg_color, outline='#1f3a5f', width=1)
+        
+        # Day number - use actual month/day from the date
+        actual_date = dates[idx]
+        month_day_str = f"{actual_date.month}/{actual_date.day}"
+        text_width = _measure_text(month_day_str, 'day')[0]
+        day_x = x + (cell_width - text_width - 10)
+        draw.text((day_x, y + 5), month_day_str, fill='#333', font=day_font)
+        
+        # Illumination percentage
+        illum_text = f"{illuminations[idx]:.0f}%"
+        draw.text((x + 10, y + 95), illum_text, fill='#333', font=tiny_font)
+        
+        # Phase name - positioned above illumination percentage
+        phase_text = phase.replace(' ', '\n') if len(phase) > 10 else phase
+        draw.text((x + 10, y + 60), phase_text, fill='#555', font=small_font)
+        
+        # Rise/Set times (simplified)
+        rise_time = rise_times[idx]
+        set_time = set_times[idx]
+        
+        if rise_time not in ['All day', 'No rise', 'Down all day']:
+            rise_simple = rise_time.split(' ')[0][:5]  # Get HH:MM
+            draw.text((x + 10, y + 110), f"Rise: {rise_simple}", fill='#4A90E2', font=tiny_font)
+        
+        if set_time not in ['No set', 'Down all day', 'All day']:
+            set_simple = set_time.split(' ')[0][:5]
+            draw.text((x + 10, y + 125), f"Set: {set_simple}", fill='#E24A90', font=tiny_font)
+        
+        # Special indicators
+        special_y = y + 145
+        has_special = False
+        
+        if supermoons[idx]:
+            draw.text((x + 10, special_y), "* Supermoon", fill='#FF6347', font=tiny_font)
+            has_special = True
+        
+        # Only show eclipse if type is present and not 'None'
+        eclipse_type = eclipse_types[idx]
+        if pd.notna(eclipse_type) and eclipse_type != 'None':
+            eclipse_text = f"Eclipse: {eclipse_type}"
+            draw.text((x + 10, special_y + 12 if has_special else special_y), 
+                     eclipse_text, fill='#8B0000', font=tiny_font)
+    
+    img_buffer = io.BytesIO()
+    img.save(img_buffer, format='PNG')
+    return img_buffer.getvalue()
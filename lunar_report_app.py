@@ -3,10 +3,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 import plotly.express as px
-import plotly.graph_objects as go
-from PIL import Image, ImageDraw, ImageFont
-import io
-import platform
+import os
+from calendar_image import generate_calendar_image
 
 # Page configuration
 st.set_page_config(
@@ -15,193 +13,48 @@ st.set_page_config(
     layout="wide"
 )
 
+# Column renames that make every field a valid itertuples() attribute name
+ROW_FIELD_NAMES = {
+    'Illumination_%': 'Illumination_pct',
+    'Eclipse_Depth_%': 'Eclipse_Depth_pct'
+}
+
+# Moon phases in lunar-cycle order; category codes double as the phase number
+PHASE_ORDER = [
+    'New Moon',
+    'Waxing Crescent',
+    'First Quarter',
+    'Waxing Gibbous',
+    'Full Moon',
+    'Waning Gibbous',
+    'Last Quarter',
+    'Waning Crescent'
+]
+
 # Load data
 @st.cache_data
 def load_data():
-    df = pd.read_csv('lunar_data_1900_2035.csv')
-    # Convert Date to datetime
+    # Prefer the typed Parquet copy; fall back to parsing the CSV
+    if os.path.exists('lunar_data_1900_2035.parquet'):
+        df = pd.read_parquet('lunar_data_1900_2035.parquet')
+    else:
+        df = pd.read_csv('lunar_data_1900_2035.csv')
+    # Convert Date to datetime and keep rows in date order for searchsorted
     df['Date'] = pd.to_datetime(df['Date'])
+    df = df.sort_values('Date', kind='stable').reset_index(drop=True)
+    # Low-cardinality string columns compare and group faster as categoricals
+    df['Phase'] = df['Phase'].astype(pd.CategoricalDtype(PHASE_ORDER, ordered=True))
+    df['Eclipse_Type'] = df['Eclipse_Type'].astype('category')
+    # Phase position in the lunar cycle (0 = New Moon ... 7 = Waning Crescent)
+    df['Phase_Num'] = df['Phase'].cat.codes
     return df
 
-def generate_calendar_image(report_data):
+@st.cache_data(show_spinner=False)
+def render_calendar_png(report_data):
     """
-    Generate a calendar image showing 30 days of lunar data
-    Returns PIL Image object
+    Cached wrapper around generate_calendar_image, keyed on the 30-day window
     """
-    # Constants
-    cell_width = 150
-    cell_height = 180
-    header_height = 60
-    title_height = 80
-    padding = 20
-    calendar_width = 7 * cell_width + 2 * padding
-    # Get the weekday of the first date (0=Sunday, 1=Monday, ..., 6=Saturday)
-    # Python weekday(): Monday=0, Tuesday=1, ..., Sunday=6
-    # Convert to Sunday=0, Monday=1, ..., Saturday=6
-    if len(report_data) > 0:
-        first_date = report_data.iloc[0]['Date']
-        first_weekday = (first_date.weekday() + 1) % 7
-    else:
-        first_weekday = 0
-    
-    # Calculate number of rows needed (30 days, starting from any day of week)
-    num_days = len(report_data) if len(report_data) > 0 else 30
-    # Calculate rows: last day position is first_weekday + (num_days - 1)
-    num_rows = ((first_weekday + num_days - 1) // 7) + 1
-    calendar_height = title_height + header_height + num_rows * cell_height + 2 * padding
-    
-    # Create image with white background
-    img = Image.new('RGB', (calendar_width, calendar_height), color='white')
-    draw = ImageDraw.Draw(img)
-    
-    # Try to load fonts, fall back to default if not available
-    try:
-        # Use different paths based on OS
-        if platform.system() == 'Windows':
-            font_path = "C:/Windows/Fonts/arial.ttf"
-        else:
-            # Try common Linux/Mac paths
-            font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
-        
-        title_font = ImageFont.truetype(font_path, 32)
-        header_font = ImageFont.truetype(font_path, 25)
-        day_font = ImageFont.truetype(font_path, 18)
-        small_font = ImageFont.truetype(font_path, 15)
-        tiny_font = ImageFont.truetype(font_path, 13)
-    except:
-        # Fallback to default font
-        title_font = ImageFont.load_default()
-        header_font = ImageFont.load_default()
-        day_font = ImageFont.load_default()
-        small_font = ImageFont.load_default()
-        tiny_font = ImageFont.load_default()
-    
-    # Draw title
-    title_text = f"30-Day Lunar Calendar"
-    if len(report_data) > 0:
-        start_date = report_data.iloc[0]['Date'].strftime('%B %d')
-        end_date = report_data.iloc[-1]['Date'].strftime('%B %d, %Y')
-        title_text = f"30-Day Lunar Calendar: {start_date} - {end_date}"
-    
-    # Helper function to get text width
-    def get_text_width(text, font):
-        try:
-            if hasattr(draw, 'textbbox'):
-                bbox = draw.textbbox((0, 0), text, font=font)
-                return bbox[2] - bbox[0]
-            if hasattr(draw, 'textlength'):
-                return int(draw.textlength(text, font=font))
-            if hasattr(font, 'getbbox'):
-                bbox = font.getbbox(text)
-                return bbox[2] - bbox[0]
-            if hasattr(font, 'getsize'):
-                w, _ = font.getsize(text)
-                return w
-        except Exception:
-            pass
-        # Conservative fallback
-        return max(0, len(text) * 8)
-
-    # Helper function to get text height
-    def get_text_height(text, font):
-        try:
-            if hasattr(draw, 'textbbox'):
-                bbox = draw.textbbox((0, 0), text, font=font)
-                return bbox[3] - bbox[1]
-            if hasattr(font, 'getbbox'):
-                bbox = font.getbbox(text)
-                return bbox[3] - bbox[1]
-            if hasattr(font, 'getsize'):
-                _, h = font.getsize(text)
-                return h
-        except Exception:
-            pass
-        return 14
-    
-    # Get text bounding box for centering
-    text_width = get_text_width(title_text, title_font)
-    title_x = (calendar_width - text_width) // 2
-    draw.text((title_x, padding), title_text, fill='#1f3a5f', font=title_font)
-    
-    # Draw week headers
-    week_days = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat']
-    for i, day in enumerate(week_days):
-        x = padding + i * cell_width
-        y = title_height + padding
-        draw.rectangle([x, y, x + cell_width, y + header_height], 
-                      fill='#4A90E2', outline='#1f3a5f', width=2)
-        # Center text
-        text_width = get_text_width(day, header_font)
-        text_x = x + (cell_width - text_width) // 2
-        draw.text((text_x, y + 15), day, fill='white', font=header_font)
-    
-    # Draw calendar cells
-    for idx, (_, data_row) in enumerate(report_data.iterrows()):
-        # Calculate grid position with correct day-of-week alignment
-        # col_idx starts at first_weekday and wraps around
-        col_idx = (first_weekday + idx) % 7
-        # row_idx accounts for the offset from the start
-        row_idx = (first_weekday + idx) // 7
-        
-        x = padding + col_idx * cell_width
-        y = title_height + padding + header_height + row_idx * cell_height
-        
-        # Cell background color based on phase
-        phase = data_row['Phase']
-        if phase == 'Full Moon':
-            bg_color = '#FFE4B5'
-        elif phase == 'New Moon':
-            bg_color = '#E6E6FA'
-        elif 'Waxing' in phase:
-            bg_color = '#FFF8DC'
-        else:
-            bg_color = '#F0F0F0'
-        
-        draw.rectangle([x, y, x + cell_width - 2, y + cell_height - 2], 
-                      fill=bg_color, outline='#1f3a5f', width=1)
-        
-        # Day number - use actual month/day from the date
-        actual_date = data_row['Date']
-        month_day_str = f"{actual_date.month}/{actual_date.day}"
-        text_width = get_text_width(month_day_str, day_font)
-        day_x = x + (cell_width - text_width - 10)
-        draw.text((day_x, y + 5), month_day_str, fill='#333', font=day_font)
-        
-        # Illumination percentage
-        illum_text = f"{data_row['Illumination_%']:.0f}%"
-        draw.text((x + 10, y + 95), illum_text, fill='#333', font=tiny_font)
-        
-        # Phase name - positioned above illumination percentage
-        phase_text = phase.replace(' ', '\n') if len(phase) > 10 else phase
-        draw.text((x + 10, y + 60), phase_text, fill='#555', font=small_font)
-        
-        # Rise/Set times (simplified)
-        rise_time = data_row['Moon_Rise']
-        set_time = data_row['Moon_Set']
-        
-        if rise_time not in ['All day', 'No rise', 'Down all day']:
-            rise_simple = rise_time.split(' ')[0][:5]  # Get HH:MM
-            draw.text((x + 10, y + 110), f"Rise: {rise_simple}", fill='#4A90E2', font=tiny_font)
-        
-        if set_time not in ['No set', 'Down all day', 'All day']:
-            set_simple = set_time.split(' ')[0][:5]
-            draw.text((x + 10, y + 125), f"Set: {set_simple}", fill='#E24A90', font=tiny_font)
-        
-        # Special indicators
-        special_y = y + 145
-        has_special = False
-        
-        if data_row['Supermoon']:
-            draw.text((x + 10, special_y), "* Supermoon", fill='#FF6347', font=tiny_font)
-            has_special = True
-        
-        # Only show eclipse if type is present and not 'None'
-        if pd.notna(data_row['Eclipse_Type']) and data_row['Eclipse_Type'] != 'None':
-            eclipse_text = f"Eclipse: {data_row['Eclipse_Type']}"
-            draw.text((x + 10, special_y + 12 if has_special else special_y), 
-                     eclipse_text, fill='#8B0000', font=tiny_font)
-    
-    return img
+    return generate_calendar_image(report_data)
 
 # Load the data
 df = load_data()
@@ -226,33 +79,37 @@ selected_date = st.sidebar.date_input(
     max_value=max_date.date()
 )
 
-# Filter data for the selected 30-day period
-report_data = df[df['Date'] >= pd.Timestamp(selected_date)]
-report_data = report_data.head(30).copy()
+# Slice the selected 30-day period starting at the first row on/after the date
+# (read-only below, so no defensive copy is needed)
+start_idx = df['Date'].searchsorted(pd.Timestamp(selected_date))
+report_data = df.iloc[start_idx:start_idx + 30]
+
+# Per-phase day counts (one pass over the categorical Phase column)
+phase_counts = report_data['Phase'].value_counts(sort=False)
+
+# Event masks, computed once and shared by the metrics and Special Events
+supermoon_mask = report_data['Supermoon'].to_numpy(dtype=bool)
+# Exclude NaN (code -1) and 'None' eclipse types by comparing category codes
+eclipse_types = report_data['Eclipse_Type'].cat
+none_code = eclipse_types.categories.get_loc('None') if 'None' in eclipse_types.categories else -1
+ecl_codes = eclipse_types.codes.to_numpy()
+ecl_mask = (ecl_codes != -1) & (ecl_codes != none_code)
 
 # Main metrics
 st.markdown("---")
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    # Find Full Moons
-    full_moons = report_data[report_data['Phase'] == 'Full Moon']
-    st.metric("Full Moons", len(full_moons))
+    st.metric("Full Moons", int(phase_counts.get('Full Moon', 0)))
     
 with col2:
-    # Find New Moons
-    new_moons = report_data[report_data['Phase'] == 'New Moon']
-    st.metric("New Moons", len(new_moons))
+    st.metric("New Moons", int(phase_counts.get('New Moon', 0)))
 
 with col3:
-    # Find Supermoons
-    supermoons = report_data[report_data['Supermoon'] == True]
-    st.metric("Supermoons", len(supermoons))
+    st.metric("Supermoons", int(supermoon_mask.sum()))
 
 with col4:
-    # Find Eclipses (exclude NaN and 'None')
-    eclipses = report_data[pd.notna(report_data['Eclipse_Type']) & (report_data['Eclipse_Type'] != 'None')]
-    st.metric("Lunar Eclipses", len(eclipses))
+    st.metric("Lunar Eclipses", int(ecl_mask.sum()))
 
 st.markdown("---")
 
@@ -297,18 +154,7 @@ with tab1:
     st.plotly_chart(fig, use_container_width=True)
 
 with tab2:
-    # Phase timeline visualization
-    report_data['Phase_Num'] = report_data['Phase'].map({
-        'New Moon': 0,
-        'Waxing Crescent': 1,
-        'First Quarter': 2,
-        'Waxing Gibbous': 3,
-        'Full Moon': 4,
-        'Waning Gibbous': 5,
-        'Last Quarter': 6,
-        'Waning Crescent': 7
-    })
-    
+    # Phase timeline visualization (Phase_Num is precomputed in load_data)
     fig = px.scatter(
         report_data,
         x='Date',
@@ -317,7 +163,8 @@ with tab2:
         size='Illumination_%',
         title='Moon Phase Timeline',
         labels={'Phase_Num': 'Phase', 'Date': 'Date'},
-        hover_data=['Phase', 'Illumination_%']
+        hover_data=['Phase', 'Illumination_%'],
+        render_mode='webgl'
     )
     fig.update_yaxes(
         tickmode='array',
@@ -329,34 +176,24 @@ with tab2:
     st.plotly_chart(fig, use_container_width=True)
 
 with tab3:
-    # Rise and Set times
-    # Clean the data for visualization
-    viz_data = report_data.copy()
-    
-    # Filter out special cases
-    viz_data = viz_data[
-        (viz_data['Moon_Rise'] != 'All day') & 
-        (viz_data['Moon_Rise'] != 'No rise') &
-        (viz_data['Moon_Set'] != 'Down all day') &
-        (viz_data['Moon_Set'] != 'No set')
-    ]
+    # Rise and Set times (graph_objects is only needed for this tab)
+    import plotly.graph_objects as go
     
-    # Convert time strings to datetime for plotting
-    def parse_time_to_hours(time_str):
-        try:
-            time_only = time_str.split(' ')[0]  # Get 'HH:MM:SS'
-            hours, minutes, seconds = map(int, time_only.split(':'))
-            return hours + minutes/60 + seconds/3600
-        except:
-            return None
-    
-    viz_data['Rise_Hour'] = viz_data['Moon_Rise'].apply(parse_time_to_hours)
-    viz_data['Set_Hour'] = viz_data['Moon_Set'].apply(parse_time_to_hours)
+    # Convert 'HH:MM:SS UTC' strings to fractional hours in one pass over
+    # both columns; special cases such as 'No rise' or 'No set' become NaN
+    # and are skipped by plotly
+    clock = report_data[['Moon_Rise', 'Moon_Set']].stack().str.split(n=1).str[0]
+    hours = (pd.to_timedelta(clock, errors='coerce').dt.total_seconds() / 3600.0).unstack()
+    viz_data = pd.DataFrame({
+        'Date': report_data['Date'],
+        'Rise_Hour': hours['Moon_Rise'],
+        'Set_Hour': hours['Moon_Set']
+    })
     
     # Create line plot
     fig = go.Figure()
     
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=viz_data['Date'],
         y=viz_data['Rise_Hour'],
         mode='lines+markers',
@@ -365,7 +202,7 @@ with tab3:
         marker=dict(size=5)
     ))
     
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=viz_data['Date'],
         y=viz_data['Set_Hour'],
         mode='lines+markers',
@@ -389,16 +226,13 @@ st.markdown("---")
 # Visual Calendar Image Section
 st.header("📅 Visual Calendar")
 
-# Generate the calendar image
-calendar_img = generate_calendar_image(report_data)
+# Generate the calendar image (PNG bytes, reused across reruns)
+calendar_png = render_calendar_png(report_data)
 
 # Display the image
-st.image(calendar_img, use_container_width=False)
+st.image(calendar_png, use_container_width=False)
 
 # Download button
-img_buffer = io.BytesIO()
-calendar_img.save(img_buffer, format='PNG')
-img_buffer.seek(0)
 
 start_date_str = report_data.iloc[0]['Date'].strftime('%Y-%m-%d')
 end_date_str = report_data.iloc[-1]['Date'].strftime('%Y-%m-%d')
@@ -406,7 +240,7 @@ filename = f'lunar_calendar_{start_date_str}_to_{end_date_str}.png'
 
 st.download_button(
     label="⬇️ Download Calendar Image",
-    data=img_buffer,
+    data=calendar_png,
     file_name=filename,
     mime="image/png",
     use_container_width=True
@@ -421,27 +255,28 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("🔴 Eclipses")
-    # Exclude NaN and 'None' eclipse types
-    eclipse_data = report_data[pd.notna(report_data['Eclipse_Type']) & (report_data['Eclipse_Type'] != 'None')]
+    eclipse_data = report_data[ecl_mask]
     
     if len(eclipse_data) > 0:
-        for idx, row in eclipse_data.iterrows():
-            with st.expander(f"{row['Date'].strftime('%B %d, %Y')} - {row['Eclipse_Type']} Eclipse"):
-                if pd.notna(row.get('Eclipse_Depth_%')):
-                    st.write(f"**Depth:** {row['Eclipse_Depth_%']}%")
-                if 'Eclipse_Time' in row and pd.notna(row['Eclipse_Time']) and row['Eclipse_Time'] != 'None':
-                    st.write(f"**Time:** {row['Eclipse_Time']}")
+        eclipse_rows = eclipse_data.rename(columns=ROW_FIELD_NAMES).itertuples(index=False, name='Row')
+        for row in eclipse_rows:
+            with st.expander(f"{row.Date.strftime('%B %d, %Y')} - {row.Eclipse_Type} Eclipse"):
+                if pd.notna(row.Eclipse_Depth_pct):
+                    st.write(f"**Depth:** {row.Eclipse_Depth_pct}%")
+                if pd.notna(row.Eclipse_Time) and row.Eclipse_Time != 'None':
+                    st.write(f"**Time:** {row.Eclipse_Time}")
     else:
         st.info("No lunar eclipses during this period.")
 
 with col2:
     st.subheader("✨ Supermoons")
-    supermoon_data = report_data[report_data['Supermoon'] == True]
+    supermoon_data = report_data[supermoon_mask]
     
     if len(supermoon_data) > 0:
-        for idx, row in supermoon_data.iterrows():
-            st.write(f"**{row['Date'].strftime('%B %d, %Y')}**")
-            st.write(f"Illumination: {row['Illumination_%']}%")
+        supermoon_rows = supermoon_data.rename(columns=ROW_FIELD_NAMES).itertuples(index=False, name='Row')
+        for row in supermoon_rows:
+            st.write(f"**{row.Date.strftime('%B %d, %Y')}**")
+            st.write(f"Illumination: {row.Illumination_pct}%")
             st.markdown("---")
     else:
         st.info("No supermoons during this period.")
@@ -3,26 +3,200 @@ Moon Phase Tracker - Using Skyfield
 """
 
 from datetime import datetime, timezone, timedelta
-from skyfield.api import load, Topos
+from skyfield.api import load, wgs84
+from skyfield.timelib import Time
 from skyfield import almanac
+from skyfield.nutationlib import iau2000b_radians
 import numpy as np
 import pandas as pd
 from zoneinfo import ZoneInfo
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from numpy.polynomial import chebyshev
+import bisect
+import hashlib
 import os
 
-# Load timescale and ephemeris
-ts = load.timescale()
-eph = load('de421.bsp')
-
-earth = eph['earth']
-moon = eph['moon']
-sun = eph['sun']
+# Load timescale from Skyfield's bundled leap-second and Delta T tables
+# (no download); the ephemeris is loaded lazily by _get_eph
+ts = load.timescale(builtin=True)
 
 # Eclipse constants (angular sizes in degrees)
 EARTH_ANGULAR_RADIUS_AT_MOON = 1.9   # Earth's angular radius as seen from Moon
 SUN_ANGULAR_RADIUS_AT_MOON = 0.27   # Sun's angular radius as seen from Moon (~1AU)
 
+# Altitude (degrees) at which the moon counts as risen; matches the default
+# refraction-corrected horizon used by Skyfield's risings_and_settings
+RISE_SET_HORIZON_DEGREES = -34.0 / 60.0
+# Slack on the declination-based up/down-all-day test: the moon's declination
+# moves up to ~3.6 deg in half a day, parallax lowers it up to ~1 deg and the
+# J2000 vs of-date equator differs by up to ~1 deg over 1900-2035
+RISE_SET_DECLINATION_MARGIN_DEGREES = 6.0
+
+# Phase sectors: elongation bin edges (degrees) and the phase name for each bin
+PHASE_BIN_EDGES = np.array([22.5, 67.5, 112.5, 157.5, 202.5, 247.5, 292.5, 337.5])
+PHASE_NAMES = np.array(["New Moon", "Waxing Crescent", "First Quarter", "Waxing Gibbous",
+                        "Full Moon", "Waning Gibbous", "Last Quarter", "Waning Crescent",
+                        "New Moon"])
+# Same tables as plain tuples for the scalar (bisect) lookup
+PHASE_BIN_EDGES_TUPLE = tuple(PHASE_BIN_EDGES.tolist())
+PHASE_NAMES_TUPLE = tuple(PHASE_NAMES.tolist())
+
+# Directory for cached generator output (Parquet), keyed by date range, ephemeris
+# and table format version
+CACHE_DIR = '.lunar_cache'
+EPHEMERIS_NAME = 'de421'
+# Bump CACHE_FORMAT_VERSION with any change that alters the generated table:
+# new or renamed columns, different dates or evaluation instants, or any
+# change to the computed values (even rise/set times moving by a second)
+CACHE_FORMAT_VERSION = 3
+
+# Eclipse candidate prefilter: the offset from opposition can never be less
+# than the Moon's ecliptic latitude, which changes by at most ~1.4 deg/day
+J2000_OBLIQUITY_DEGREES = 23.4392911
+MOON_LATITUDE_RATE_DEG_PER_DAY = 1.5
+ECLIPSE_LATITUDE_MARGIN_DEGREES = 0.1   # apparent vs geometric, ecliptic of date vs J2000
+
+# Eclipse types indexed by classify_eclipses' type_idx
+ECLIPSE_TYPE_NAMES = np.array([None, "Total", "Partial", "Penumbral"], dtype=object)
+# Eclipse_Type column values ("None" when there is no eclipse)
+ECLIPSE_TYPE_CATEGORIES = ["None", "Total", "Partial", "Penumbral"]
+
+
+@lru_cache(maxsize=None)
+def _get_eph():
+    """
+    Load the DE421 ephemeris on first use instead of at import time.
+    
+    Returns:
+        eph: Skyfield SpiceKernel for de421.bsp
+    """
+    return load('de421.bsp')
+
+
+@lru_cache(maxsize=None)
+def _get_chebyshev_segment(center, target, precision='full'):
+    """
+    Extract the raw Chebyshev coefficients of one DE421 segment.
+    
+    Args:
+        center: NAIF id of the segment's center (e.g. 3, Earth barycenter)
+        target: NAIF id of the segment's target (e.g. 301, Moon)
+        precision: 'full' for float64 coefficients, 'fast' for a float32 copy
+    
+    Returns:
+        initial_jd: TDB Julian date at which the first record starts
+        interval_days: Length of each record in days
+        coefficients: Array of shape (3, records, coefficients_per_record)
+    """
+    if precision == 'fast':
+        initial_jd, interval_days, coefficients = _get_chebyshev_segment(center, target)
+        return initial_jd, interval_days, coefficients.astype(np.float32)
+    segment = next(seg for seg in _get_eph().segments
+                   if seg.center == center and seg.target == target)
+    return segment.spk_segment.load_array()
+
 
+def positions_batch(jd_tdb, center, target, precision='full'):
+    """
+    Evaluate a DE421 segment directly for many TDB Julian dates.
+    
+    Skips Skyfield's per-call segment dispatch and light-time iteration,
+    so it gives geometric (not apparent) positions. precision='fast'
+    evaluates in float32 (errors of a few tens of meters at lunar distance),
+    which is plenty for distance thresholds but not for eclipse geometry.
+    
+    Args:
+        jd_tdb: Array of TDB Julian dates
+        center: NAIF id of the segment's center
+        target: NAIF id of the segment's target
+        precision: 'full' (float64, default) or 'fast' (float32)
+    
+    Returns:
+        positions: Array of shape (3, N), target relative to center in km
+    """
+    initial_jd, interval_days, coefficients = _get_chebyshev_segment(center, target, precision)
+    jd_tdb = np.asarray(jd_tdb, dtype=np.float64)
+    
+    # Records are equal-length, so the record index is a floor division
+    record = np.clip(((jd_tdb - initial_jd) // interval_days).astype(int),
+                     0, coefficients.shape[1] - 1)
+    # Chebyshev argument normalized to [-1, 1] within each record
+    x = 2.0 * (jd_tdb - initial_jd - record * interval_days) / interval_days - 1.0
+    x = x.astype(coefficients.dtype)
+    
+    record_coefficients = np.moveaxis(coefficients[:, record, :], 2, 0)
+    return chebyshev.chebval(x, record_coefficients, tensor=False)
+
+
+def geocentric_moon_position_km(jd_tdb, precision='full'):
+    """
+    Geometric geocentric Moon position (ICRS axes) for many TDB Julian dates.
+    
+    Args:
+        jd_tdb: Array of TDB Julian dates
+        precision: 'full' (float64, default) or 'fast' (float32), see positions_batch
+    
+    Returns:
+        positions: Array of shape (3, N) in km
+    """
+    # Both bodies are stored relative to the Earth-Moon barycenter (3)
+    return (positions_batch(jd_tdb, 3, 301, precision)
+            - positions_batch(jd_tdb, 3, 399, precision))
+
+
+def geocentric_moon_distance_km(jd_tdb, precision='full'):
+    """
+    Geometric Earth-Moon distance for many TDB Julian dates.
+    
+    Args:
+        jd_tdb: Array of TDB Julian dates
+        precision: 'full' (float64, default) or 'fast' (float32), see positions_batch
+    
+    Returns:
+        distances_km: Array of distances in km
+    """
+    moon_from_earth = geocentric_moon_position_km(jd_tdb, precision)
+    return np.sqrt((moon_from_earth ** 2).sum(axis=0))
+
+
+def moon_ecliptic_latitude(position_km):
+    """
+    Ecliptic latitude (J2000 ecliptic) of geocentric Moon positions.
+    
+    Args:
+        position_km: Array of shape (3, N) from geocentric_moon_position_km
+    
+    Returns:
+        latitudes: Array of ecliptic latitudes in degrees
+    """
+    obliquity = np.radians(J2000_OBLIQUITY_DEGREES)
+    x, y, z = position_km
+    ecliptic_z = -np.sin(obliquity) * y + np.cos(obliquity) * z
+    return np.degrees(np.arcsin(ecliptic_z / np.sqrt(x * x + y * y + z * z)))
+
+
+def classify_phases(elongation):
+    """
+    Phase bin and illumination from the Moon's elongation.
+    
+    Works on scalars or arrays; get_lunar_phase uses an equivalent
+    plain-float lookup for single dates.
+    
+    Args:
+        elongation: Sun-Moon elongation(s) in degrees, 0-360
+    
+    Returns:
+        phase_idx: Index into PHASE_NAMES
+        illumination: Percentage illuminated (0-100%), rounded to 0.1
+    """
+    # elongation: 0° (New) -> 180° (Full) -> 360° (New)
+    illumination = np.round((1 - np.abs(elongation - 180) / 180) * 100, 1)
+    phase_idx = np.searchsorted(PHASE_BIN_EDGES, elongation, side='right')
+    return phase_idx, illumination
+
+
+@lru_cache(maxsize=4096)
 def get_lunar_phase(date):
     """
     Get the lunar phase for a given UTC datetime.
@@ -38,38 +212,55 @@ def get_lunar_phase(date):
     
     # Calculate elongation (angle between sun and moon as seen from Earth)
     # using Skyfield's built-in moon_phase function
-    phase_angle = almanac.moon_phase(eph, t)
-    elongation = phase_angle.degrees
-    
-    # Calculate illumination percentage
-    # elongation: 0° (New) -> 180° (Full) -> 360° (New)
-    illumination = (1 - abs(elongation - 180) / 180) * 100
-    illumination = round(illumination, 1)
-    
-    # Determine phase name
-    if elongation < 22.5 or elongation >= 337.5:
-        phase_name = "New Moon"
-    elif elongation < 67.5:
-        phase_name = "Waxing Crescent"
-    elif elongation < 112.5:
-        phase_name = "First Quarter"
-    elif elongation < 157.5:
-        phase_name = "Waxing Gibbous"
-    elif elongation < 202.5:
-        phase_name = "Full Moon"
-    elif elongation < 247.5:
-        phase_name = "Waning Gibbous"
-    elif elongation < 292.5:
-        phase_name = "Last Quarter"
-    else:
-        phase_name = "Waning Crescent"
+    elongation = float(almanac.moon_phase(_get_eph(), t).degrees)
     
+    # Plain-float version of classify_phases: for a single value, bisect on
+    # a tuple avoids NumPy's per-call dispatch
+    illumination = round((1 - abs(elongation - 180) / 180) * 100, 1)
+    phase_name = PHASE_NAMES_TUPLE[bisect.bisect_right(PHASE_BIN_EDGES_TUPLE, elongation)]
     return phase_name, illumination
 
 
+def get_lunar_phases(dates):
+    """
+    Get the lunar phases for many UTC datetimes in a single Skyfield call.
+    
+    Args:
+        dates: Sequence of UTC-aware datetime objects, or a Skyfield Time
+            array that the caller has already built
+        
+    Returns:
+        phase_names: Array of phase name strings, one per date
+        illuminations: Array of illumination percentages (0-100%)
+    """
+    t = dates if isinstance(dates, Time) else ts.from_datetimes(list(dates))
+    
+    # One vectorized evaluation instead of one ephemeris lookup per date
+    elongation = almanac.moon_phase(_get_eph(), t).degrees
+    
+    phase_idx, illuminations = classify_phases(elongation)
+    return PHASE_NAMES[phase_idx], illuminations
+
+
+@lru_cache(maxsize=None)
+def _get_site(latitude, longitude, elevation_m):
+    """
+    Build the WGS84 position of an observing site once per location.
+    """
+    return wgs84.latlon(latitude, longitude, elevation_m=elevation_m)
+
+
+@lru_cache(maxsize=None)
+def _get_observer(latitude, longitude, elevation_m):
+    """
+    Earth-based observer (earth + site) for vectorized altitude sampling.
+    """
+    return _get_eph()['earth'] + _get_site(latitude, longitude, elevation_m)
+
+
 def get_moon_rise_set(date, latitude=39.9612, longitude=-82.9988, elevation_m=275.0):
     """
-    Get moon rise and set times for a given calendar day using Skyfield almanac.
+    Get moon rise and set times for a given calendar day.
     
     Args:
         date: UTC-aware datetime object
@@ -81,37 +272,246 @@ def get_moon_rise_set(date, latitude=39.9612, longitude=-82.9988, elevation_m=27
         rise_time: datetime (UTC) of first moonrise in the day, or None
         set_time: datetime (UTC) of first moonset in the day, or None
     """
-    # Observer location
-    site_topos = Topos(latitude_degrees=latitude,
-                       longitude_degrees=longitude,
-                       elevation_m=elevation_m)
+    # Declination bound: at latitude phi an object at declination dec stays
+    # between -90 + |phi + dec| and 90 - |phi - dec| degrees altitude. If the
+    # whole band is above or below the horizon there is nothing to search
+    midday = date.replace(hour=12, minute=0, second=0, microsecond=0)
+    x, y, z = geocentric_moon_position_km([ts.from_datetime(midday).tdb])[:, 0]
+    declination = np.degrees(np.arctan2(z, np.hypot(x, y)))
+    lowest = -90 + abs(latitude + declination) - RISE_SET_DECLINATION_MARGIN_DEGREES
+    highest = 90 - abs(latitude - declination) + RISE_SET_DECLINATION_MARGIN_DEGREES
+    if lowest > RISE_SET_HORIZON_DEGREES or highest < RISE_SET_HORIZON_DEGREES:
+        return None, None
+    
+    # One vectorized 72-sample altitude grid (20 minutes) over the UTC day,
+    # shared with the multi-day search
+    rise_times, set_times = get_moon_rise_set_batch(date, 1, latitude, longitude, elevation_m)
+    return rise_times[0], set_times[0]
 
-    # Start/end of the UTC day
-    start_of_day = date.replace(hour=0, minute=0, second=0, microsecond=0)
-    end_of_day = start_of_day + timedelta(days=1)
 
-    t0 = ts.utc(start_of_day)
-    t1 = ts.utc(end_of_day)
+def altitudes_batch(t, latitude=39.9612, longitude=-82.9988, elevation_m=275.0):
+    """
+    Astrometric altitude of the moon for every time in a Skyfield Time array.
+    
+    Args:
+        t: Skyfield Time (array)
+        latitude: Observer's latitude in degrees (default: 39.9612, Columbus, OH)
+        longitude: Observer's longitude in degrees (default: -82.9988, Columbus, OH)
+        elevation_m: Observer's elevation in meters (default: 275.0, Columbus, OH)
+    
+    Returns:
+        altitudes: Array of altitudes in degrees
+    """
+    observer = _get_observer(latitude, longitude, elevation_m)
+    # Astrometric rather than apparent: light deflection and aberration move
+    # the moon by ~20 arcseconds, far below the refraction uncertainty
+    astrometric = observer.at(t).observe(_get_eph()['moon'])
+    site = _get_site(latitude, longitude, elevation_m)
+    return astrometric.frame_latlon(site)[0].degrees
+
+
+def _horizon_crossings(alt):
+    """
+    Locate zero crossings in a uniformly sampled altitude series.
+    
+    Args:
+        alt: Altitudes relative to the horizon, one per grid sample
+    
+    Returns:
+        idx: Index of the sample just before each crossing
+        position: Estimated crossing position in (fractional) samples
+        rising: True for crossings from below to above the horizon
+    """
+    # Sign changes bracket the horizon crossings
+    up = alt > 0
+    idx = np.flatnonzero(up[:-1] != up[1:])
+    rising = up[idx + 1]
+    
+    # Quadratic through three samples around each crossing, solved for
+    # its zero inside the bracket [lo, lo + 1] (x in sample units)
+    mid = np.clip(idx, 1, len(alt) - 2)
+    lo = idx - mid
+    y0, y1, y2 = alt[mid - 1], alt[mid], alt[mid + 1]
+    a = (y2 - 2 * y1 + y0) / 2
+    b = (y2 - y0) / 2
+    c = y1
+    x_linear = lo + alt[idx] / (alt[idx] - alt[idx + 1])
+    sqrt_disc = np.sqrt(np.maximum(b * b - 4 * a * c, 0))
+    q = -0.5 * (b + np.copysign(sqrt_disc, b))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        roots = np.stack([q / a, c / q])
+    # Keep the root nearest the linear estimate; fall back to it if neither fits
+    pick = np.argmin(np.abs(np.nan_to_num(roots, nan=np.inf) - x_linear), axis=0)
+    x = roots[pick, np.arange(len(idx))]
+    x = np.where(np.isfinite(x) & (x >= lo) & (x <= lo + 1), x, x_linear)
+    
+    return idx, mid + x, rising
+
+
+def _refine_crossings(altitude_fn, tt_lo, alt_lo, tt_hi, alt_hi, tt_guess, iterations):
+    """
+    Polish bracketed horizon crossings with vectorized secant steps.
+    
+    Every iteration evaluates all crossings in one altitude call. A secant
+    step that leaves its bracket falls back to false position, so each
+    crossing stays between samples of opposite sign.
+    
+    Args:
+        altitude_fn: Maps an array of TT Julian dates to altitudes above the horizon
+        tt_lo, alt_lo: TT and altitude at the start of each bracket
+        tt_hi, alt_hi: TT and altitude at the end of each bracket
+        tt_guess: Initial estimate of each crossing (TT)
+        iterations: Number of secant steps
+    
+    Returns:
+        tt_cross: Refined crossing times (TT Julian dates)
+    """
+    tt_prev, alt_prev = tt_lo, alt_lo
+    tt_cur = tt_guess
+    for _ in range(iterations):
+        alt_cur = altitude_fn(tt_cur)
+        # Shrink each bracket to the side that still contains the sign change
+        same_as_lo = np.signbit(alt_cur) == np.signbit(alt_lo)
+        tt_lo, alt_lo = np.where(same_as_lo, tt_cur, tt_lo), np.where(same_as_lo, alt_cur, alt_lo)
+        tt_hi, alt_hi = np.where(same_as_lo, tt_hi, tt_cur), np.where(same_as_lo, alt_hi, alt_cur)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tt_next = tt_cur - alt_cur * (tt_cur - tt_prev) / (alt_cur - alt_prev)
+            tt_false = tt_lo - alt_lo * (tt_hi - tt_lo) / (alt_hi - alt_lo)
+        inside = np.isfinite(tt_next) & (tt_next >= tt_lo) & (tt_next <= tt_hi)
+        tt_prev, alt_prev = tt_cur, alt_cur
+        tt_cur = np.where(inside, tt_next, np.where(np.isfinite(tt_false), tt_false, tt_cur))
+    return tt_cur
+
+
+def _abridged_nutation_time(tt):
+    """
+    Skyfield Time for TT Julian dates, using the abridged nutation model.
+    
+    The IAU 2000B series is far cheaper than the full model and differs by
+    ~1 milliarcsecond, as in Skyfield's own almanac. It is set only on Time
+    objects built here for the rise/set search, never on a caller's Time.
+    """
+    t = ts.tt_jd(tt)
+    t._nutation_angles_radians = iau2000b_radians(t)
+    return t
+
+
+def get_moon_rise_set_batch(first_day, num_days, latitude=39.9612, longitude=-82.9988,
+                            elevation_m=275.0, step_minutes=20, chunk_days=366,
+                            refine_iterations=2):
+    """
+    Get moon rise and set times for many consecutive UTC calendar days.
+    
+    Samples the moon's altitude on a fixed time grid in vectorized Skyfield
+    calls, finds horizon crossings from sign changes, estimates each one
+    from a quadratic through three neighbouring samples and polishes all of
+    them together with a few vectorized secant steps.
+    
+    Args:
+        first_day: UTC-aware datetime within the first calendar day
+        num_days: Number of consecutive UTC days to cover
+        latitude: Observer's latitude in degrees (default: 39.9612, Columbus, OH)
+        longitude: Observer's longitude in degrees (default: -82.9988, Columbus, OH)
+        elevation_m: Observer's elevation in meters (default: 275.0, Columbus, OH)
+        step_minutes: Altitude sampling interval in minutes (default: 20);
+            at mid latitudes two horizon crossings never fall within one step
+        chunk_days: Days evaluated per Skyfield call, to bound memory use
+        refine_iterations: Secant steps applied to every crossing (default: 2)
+    
+    Returns:
+        rise_times: List of datetime (UTC) of first moonrise in each day, or None
+        set_times: List of datetime (UTC) of first moonset in each day, or None
+    """
+    start_of_day = first_day.replace(hour=0, minute=0, second=0, microsecond=0)
+    steps_per_day = 24 * 60 // step_minutes
+    
+    def altitude_fn(tt):
+        return (altitudes_batch(_abridged_nutation_time(tt), latitude, longitude, elevation_m)
+                - RISE_SET_HORIZON_DEGREES)
+    
+    rise_times = [None] * num_days
+    set_times = [None] * num_days
+    
+    for chunk_start in range(0, num_days, chunk_days):
+        chunk_len = min(chunk_days, num_days - chunk_start)
+        chunk_day0 = start_of_day + timedelta(days=chunk_start)
+        
+        # Altitude grid covering the chunk, including its closing endpoint,
+        # stepped directly in TT Julian days from the chunk's first midnight
+        tt0 = ts.utc(chunk_day0.year, chunk_day0.month, chunk_day0.day).tt
+        t_grid = _abridged_nutation_time(tt0 + np.arange(chunk_len * steps_per_day + 1) / steps_per_day)
+        alt = altitudes_batch(t_grid, latitude, longitude, elevation_m) - RISE_SET_HORIZON_DEGREES
+        
+        idx, position, rising = _horizon_crossings(alt)
+        tt_lo, tt_hi = t_grid.tt[idx], t_grid.tt[idx + 1]
+        tt_cross = tt_lo + (position - idx) * (tt_hi - tt_lo)
+        if len(idx) and refine_iterations:
+            tt_cross = _refine_crossings(altitude_fn, tt_lo, alt[idx], tt_hi, alt[idx + 1],
+                                         tt_cross, refine_iterations)
+        day_idx = ((idx + (tt_cross - tt_lo) / (tt_hi - tt_lo)) // steps_per_day).astype(int)
+        
+        # Crossings are in time order, so the first one per day wins
+        for is_rise, slots in ((True, rise_times), (False, set_times)):
+            sel = np.flatnonzero(rising == is_rise)
+            days, first = np.unique(day_idx[sel], return_index=True)
+            keep = days < chunk_len
+            days, first = days[keep], sel[first[keep]]
+            if len(first) == 0:
+                continue
+            cross_datetimes = ts.tt_jd(tt_cross[first]).utc_datetime()
+            for day, when in zip(days, cross_datetimes):
+                slots[chunk_start + day] = when
+    
+    return rise_times, set_times
 
-    # Build above-horizon function and find discrete transitions
-    above_horizon_fn = almanac.risings_and_settings(eph, moon, site_topos)
-    times, events = almanac.find_discrete(t0, t1, above_horizon_fn)
 
-    # Extract first rise and set times within the day
-    rise_time = None
-    set_time = None
-    for t, ev in zip(times, events):
-        if ev == 1 and rise_time is None:  # rising edge
-            rise_time = t.utc_datetime()
-        elif ev == 0 and set_time is None:  # setting edge
-            set_time = t.utc_datetime()
+def classify_eclipses(offset):
+    """
+    Classify eclipse type and shadow depth from offsets to opposition.
+    
+    Works on scalars or arrays, so the single-time and batched eclipse
+    checks share one classification.
+    
+    Args:
+        offset: Angle(s) from perfect opposition in degrees
+    
+    Returns:
+        type_idx: Index into ECLIPSE_TYPE_NAMES (0 = no eclipse)
+        depth: Shadow depth 0-100 as integers
+    """
+    # Shadow cone angles (in degrees) - based on angular sizes
+    # Penumbra: Earth + Sun angular radii
+    # Umbra: Earth - Sun angular radii  
+    penumbra_radius = EARTH_ANGULAR_RADIUS_AT_MOON + SUN_ANGULAR_RADIUS_AT_MOON
+    umbra_radius = EARTH_ANGULAR_RADIUS_AT_MOON - SUN_ANGULAR_RADIUS_AT_MOON
+    
+    type_idx = np.select([offset < umbra_radius * 0.5, offset < umbra_radius, offset < penumbra_radius],
+                         [1, 2, 3], default=0)
+    depth = np.select([type_idx == 1, type_idx == 2, type_idx == 3],
+                      [100 * (1 - offset / umbra_radius), 100 * (1 - offset / umbra_radius),
+                       50 * (1 - offset / penumbra_radius)], default=0).astype(int)
+    return type_idx, depth
 
-        if rise_time is not None and set_time is not None:
-            break
 
-    return rise_time, set_time
+def _parse_utc(date_str):
+    """
+    Parse 'YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS' into a UTC datetime.
+    
+    Fixed-position slicing instead of strptime; any other layout falls
+    back to strptime so malformed input still raises ValueError.
+    """
+    if len(date_str) in (10, 19) and date_str[4] == '-' and date_str[7] == '-':
+        year, month, day = int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10])
+        if len(date_str) == 10:
+            return datetime(year, month, day, tzinfo=timezone.utc)
+        if date_str[10] == ' ' and date_str[13] == ':' and date_str[16] == ':':
+            return datetime(year, month, day, int(date_str[11:13]), int(date_str[14:16]),
+                            int(date_str[17:19]), tzinfo=timezone.utc)
+    return datetime.strptime(date_str, '%Y-%m-%d').replace(tzinfo=timezone.utc)
 
 
+@lru_cache(maxsize=4096)
 def check_lunar_eclipse(date):
     """
     Check for lunar eclipse at given time.
@@ -121,79 +521,360 @@ def check_lunar_eclipse(date):
         elongation: angle from opposition
     """
     if isinstance(date, str):
-        date = datetime.strptime(date, '%Y-%m-%d')
+        date = _parse_utc(date)
     if date.tzinfo is None:
         date = date.replace(tzinfo=timezone.utc)
     
-    t = ts.utc(date)
-    sun_vec = earth.at(t).observe(sun).apparent()
-    moon_vec = earth.at(t).observe(moon).apparent()
+    # Offset from perfect opposition (one earth.at() shared by sun and moon)
+    offset = _opposition_offset(ts.utc(date))
     
     # Elongation check: must be near opposition (full moon)
-    elongation = sun_vec.separation_from(moon_vec).degrees
-    if abs(elongation - 180) > 5:  # Not close enough to opposition
-        return None, 0, abs(elongation - 180)
+    if offset > 5:  # Not close enough to opposition
+        return None, 0, offset
     
-    # Shadow cone angles (in degrees) - based on angular sizes
-    # Penumbra: Earth + Sun angular radii
-    # Umbra: Earth - Sun angular radii  
+    type_idx, depth = classify_eclipses(offset)
+    return ECLIPSE_TYPE_NAMES[type_idx], int(depth), offset
+
+
+def sample_night_for_eclipse(date_utc, rise_time, set_time):
+    """
+    Find the maximum eclipse during a single night (moonrise to moonset).
+    Returns: (eclipse_type, shadow_depth, max_eclipse_time_utc)
+    """
+    eclipse_types, depths, best_times = sample_nights_for_eclipse([rise_time], [set_time])
+    return eclipse_types[0], depths[0], best_times[0]
+
+
+def _opposition_offset(times):
+    """
+    Angle (degrees) between the moon and the point opposite the sun.
+    
+    Args:
+        times: Skyfield Time (scalar or array)
+    
+    Returns:
+        offset: Degrees from perfect opposition
+    """
+    eph = _get_eph()
+    earth_at = eph['earth'].at(times)
+    sun_vec = earth_at.observe(eph['sun']).apparent()
+    moon_vec = earth_at.observe(eph['moon']).apparent()
+    return np.abs(sun_vec.separation_from(moon_vec).degrees - 180)
+
+
+def sample_nights_for_eclipse(rise_times, set_times):
+    """
+    Find the maximum eclipse during many nights at once.
+    
+    The moon moves almost uniformly past the shadow over one night, so the
+    squared offset from opposition is close to a parabola in time. Each
+    night is sampled at moonrise, midway and moonset; the parabola's
+    minimum (clamped to the visible window) is then evaluated once more
+    and classified. All nights share the same two Skyfield calls.
+    
+    Args:
+        rise_times: Sequence of moonrise datetimes (UTC), or None
+        set_times: Sequence of moonset datetimes (UTC), or None
+    
+    Returns: (eclipse_types, shadow_depths, max_eclipse_times_utc) lists with
+        one entry per night, matching sample_night_for_eclipse
+    """
+    num_nights = len(rise_times)
+    eclipse_types = [None] * num_nights
+    depths = [0] * num_nights
+    best_times = [None] * num_nights
+    
+    # Only nights with both a rise and a set are sampled
+    nights = [i for i in range(num_nights) if rise_times[i] and set_times[i]]
+    if not nights:
+        return eclipse_types, depths, best_times
+    
+    # Visible window per night; moon sets next day if set is before rise
+    starts = [rise_times[i] for i in nights]
+    ends = [set_times[i] if set_times[i] >= rise_times[i] else set_times[i] + timedelta(days=1)
+            for i in nights]
+    bounds_tt = ts.from_datetimes(starts + ends).tt
+    start_tt = bounds_tt[:len(starts)]
+    span_tt = bounds_tt[len(starts):] - start_tt
+    
+    # Squared offset at rise (u=-1), midpoint (u=0) and set (u=1)
+    u_samples = np.array([-1.0, 0.0, 1.0])
+    sample_tt = start_tt[:, None] + (u_samples[None, :] + 1) / 2 * span_tt[:, None]
+    y = _opposition_offset(ts.tt_jd(sample_tt.ravel())).reshape(sample_tt.shape) ** 2
+    
+    # Vertex of the parabola through the three samples, clamped to the window;
+    # if it opens downward the smallest sample is the minimum
+    a = (y[:, 2] - 2 * y[:, 1] + y[:, 0]) / 2
+    b = (y[:, 2] - y[:, 0]) / 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        u_vertex = np.clip(-b / (2 * a), -1, 1)
+    u_best = np.where(a > 0, u_vertex, u_samples[np.argmin(y, axis=1)])
+    
+    best_t = ts.tt_jd(start_tt + (u_best + 1) / 2 * span_tt)
+    type_idx, depth = classify_eclipses(_opposition_offset(best_t))
+    
+    best_utc = best_t.utc_datetime()
+    for row, i in enumerate(nights):
+        if depth[row] > 0:
+            eclipse_types[i] = ECLIPSE_TYPE_NAMES[type_idx[row]]
+            depths[i] = int(depth[row])
+            best_times[i] = best_utc[row]
+    
+    return eclipse_types, depths, best_times
+
+
+def _eclipse_candidates(date_utcs, illuminations, ecliptic_latitudes, rise_times, set_times):
+    """
+    Days whose night could contain a lunar eclipse.
+    
+    Near full moon only (illumination > 85%), and only if the Moon's
+    ecliptic latitude at the evaluation instant, less the most it can change
+    before the furthest end of the night's window, is inside the penumbra.
+    
+    Returns:
+        candidates: Array of day indices, in day order
+    """
     penumbra_radius = EARTH_ANGULAR_RADIUS_AT_MOON + SUN_ANGULAR_RADIUS_AT_MOON
-    umbra_radius = EARTH_ANGULAR_RADIUS_AT_MOON - SUN_ANGULAR_RADIUS_AT_MOON
+    candidates = []
+    for day in np.flatnonzero(illuminations > 85):
+        rise_time, set_time = rise_times[day], set_times[day]
+        if not rise_time or not set_time:
+            continue
+        night_end = set_time if set_time >= rise_time else set_time + timedelta(days=1)
+        reach_days = max(abs(rise_time - date_utcs[day]), abs(night_end - date_utcs[day])) / timedelta(days=1)
+        closest_latitude = abs(ecliptic_latitudes[day]) - MOON_LATITUDE_RATE_DEG_PER_DAY * reach_days
+        if closest_latitude < penumbra_radius + ECLIPSE_LATITUDE_MARGIN_DEGREES:
+            candidates.append(day)
+    return np.array(candidates, dtype=int)
+
+
+def _compute_days(date_utcs):
+    """
+    Phase, illumination, supermoon and rise/set values for consecutive days.
+    
+    Args:
+        date_utcs: List of consecutive daily evaluation instants (UTC-aware)
+    
+    Returns:
+        days: Dictionary of per-day arrays: phases, illuminations, supermoon,
+            rise_times, set_times and up/down-all-day flags
+        moon_position_km: Geocentric Moon positions at the evaluation instants
+    """
+    num_days = len(date_utcs)
+    
+    # Phase, illumination and geocentric distance for every day at once,
+    # in a few vectorized Skyfield calls rather than one per day
+    t_all = ts.from_datetimes(date_utcs)
+    phases, illuminations = get_lunar_phases(t_all)
+    # float32 is ample for the 360,000 km cutoff and the latitude prefilter
+    moon_position_km = geocentric_moon_position_km(t_all.tdb, precision='fast')
+    distances_km = np.sqrt((moon_position_km ** 2).sum(axis=0))
+    # Supermoon definition: Full Moon and ≤360,000 km
+    supermoon_flags = (phases == "Full Moon") & (distances_km <= 360000)
     
-    # Offset from perfect opposition
-    offset = abs(elongation - 180)
+    # Moon rise/set times for the UTC calendar day of every evaluation instant
+    rise_times, set_times = get_moon_rise_set_batch(date_utcs[0], num_days)
     
-    # Classify eclipse
-    if offset < umbra_radius * 0.5:
-        return "Total", int(100 * (1 - offset / umbra_radius)), offset
-    elif offset < umbra_radius:
-        return "Partial", int(100 * (1 - offset / umbra_radius)), offset
-    elif offset < penumbra_radius:
-        return "Penumbral", int(50 * (1 - offset / penumbra_radius)), offset
-    return None, 0, offset
+    # Days with no horizon crossing at all: the moon is up (or down) all day,
+    # which a single altitude inside the day tells apart
+    up_all_day = np.zeros(num_days, dtype=bool)
+    down_all_day = np.zeros(num_days, dtype=bool)
+    no_events = np.array([rise is None and set_ is None for rise, set_ in zip(rise_times, set_times)])
+    if no_events.any():
+        above = altitudes_batch(t_all[no_events]) > RISE_SET_HORIZON_DEGREES
+        up_all_day[no_events] = above
+        down_all_day[no_events] = ~above
+    
+    days = {
+        'phases': phases,
+        'illuminations': illuminations,
+        'supermoon': supermoon_flags,
+        'rise_times': np.array(rise_times, dtype=object),
+        'set_times': np.array(set_times, dtype=object),
+        'up_all_day': up_all_day,
+        'down_all_day': down_all_day,
+    }
+    return days, moon_position_km
 
 
-def sample_night_for_eclipse(date_utc, rise_time, set_time):
+def compute_chunk(date_utcs):
     """
-    Sample throughout a single night (hourly) to find maximum eclipse.
-    Returns: (eclipse_type, shadow_depth, max_eclipse_time_utc)
+    Compute the raw per-day lunar values for a run of consecutive days.
+    
+    Runs in a worker process when generate_lunar_data splits the range;
+    each worker loads its own ephemeris on first use.
+    
+    Args:
+        date_utcs: List of consecutive daily evaluation instants (UTC-aware)
+    
+    Returns:
+        Dictionary of per-day arrays: phases, illuminations, supermoon,
+        rise_times, set_times, up/down-all-day flags and the night's eclipse
+        type, depth and time
     """
-    if not rise_time or not set_time:
-        return None, 0, None
+    num_days = len(date_utcs)
+    days, moon_position_km = _compute_days(date_utcs)
+    rise_times, set_times = days['rise_times'], days['set_times']
     
-    best_eclipse_type = None
-    best_depth = 0
-    best_time = None
+    # Eclipse search: maximum eclipse during each night, only near full moon
+    # and only where the Moon can get within the penumbra during the night
+    eclipse_candidates = _eclipse_candidates(
+        date_utcs, days['illuminations'], moon_ecliptic_latitude(moon_position_km),
+        rise_times, set_times)
+    candidate_eclipses = sample_nights_for_eclipse(
+        [rise_times[day] for day in eclipse_candidates],
+        [set_times[day] for day in eclipse_candidates]
+    )
+    night_types = np.full(num_days, None, dtype=object)
+    night_depths = np.zeros(num_days, dtype=int)
+    night_times = np.full(num_days, None, dtype=object)
+    night_types[eclipse_candidates], night_depths[eclipse_candidates], night_times[eclipse_candidates] = (
+        np.array(col, dtype=object) for col in candidate_eclipses)
     
-    # Get the sampling window from rise/set times
-    night_start = rise_time
-    night_end = set_time
-    # If set time is before rise time on the calendar, moon sets next day
-    if night_end < night_start:
-        night_end = night_end + timedelta(days=1)
+    days.update(night_types=night_types, night_depths=night_depths, night_times=night_times)
+    return days
+
+
+def day_summary(date):
+    """
+    Phase, illumination and rise/set information for one day in one pass.
     
-    # Sample every hour throughout the visible period
-    current_time = night_start
-    max_samples = 48  # Safety: max 2 days of hourly samples
-    sample_count = 0
+    Runs the same fused pipeline as the table generator (one Time for the
+    phase instant, one altitude grid for the day) instead of separate
+    get_lunar_phase and get_moon_rise_set calls; the eclipse search is
+    skipped.
     
-    while current_time <= night_end and sample_count < max_samples:
-        eclipse_type, depth, _ = check_lunar_eclipse(current_time)
-        
-        # Track best eclipse found
-        if eclipse_type and depth > best_depth:
-            best_eclipse_type = eclipse_type
-            best_depth = depth
-            best_time = current_time
-        
-        current_time += timedelta(hours=1)
-        sample_count += 1
-        
-        # Safety check: don't sample beyond 48 hours
-        if (current_time - night_start).total_seconds() > 86400 * 2:
-            break
+    Args:
+        date: UTC-aware datetime; rise/set cover its UTC calendar day
     
-    return best_eclipse_type, best_depth, best_time
+    Returns:
+        phase_name, illumination, rise_time, set_time, up_all_day, down_all_day
+    """
+    day, _ = _compute_days([date])
+    return (str(day['phases'][0]), float(day['illuminations'][0]),
+            day['rise_times'][0], day['set_times'][0],
+            bool(day['up_all_day'][0]), bool(day['down_all_day'][0]))
+
+
+def generate_lunar_data(start_date, end_date, workers=None, chunk_days=366):
+    """
+    Compute the lunar data table for every day in a date range.
+    
+    The range is split into chunks of consecutive days that are computed
+    in parallel worker processes and concatenated; eclipses are then
+    assigned to calendar dates over the whole range.
+    
+    Args:
+        start_date: Timezone-aware datetime of the first evaluation instant
+        end_date: Timezone-aware datetime of the last evaluation instant
+        workers: Number of worker processes (default: os.cpu_count())
+        chunk_days: Days per chunk (default: 366)
+    
+    Returns:
+        df: DataFrame with one row per day, as written to the CSV
+    """
+    eastern = start_date.tzinfo
+    
+    # Evaluation instants: the same local wall-clock time (11PM Eastern) on
+    # every day in the range, so the UTC offset follows DST; converted to
+    # UTC once for the whole range
+    local_index = pd.date_range(start_date.replace(tzinfo=None), end_date.replace(tzinfo=None),
+                                freq='D').tz_localize(eastern)
+    utc_index = local_index.tz_convert('UTC')
+    total_days = len(local_index)
+    date_utcs = list(utc_index.to_pydatetime())
+    
+    chunks = [date_utcs[i:i + chunk_days] for i in range(0, total_days, chunk_days)]
+    workers = min(workers or os.cpu_count() or 1, len(chunks))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(compute_chunk, chunks))
+    else:
+        results = [compute_chunk(chunk) for chunk in chunks]
+    columns = {key: np.concatenate([result[key] for result in results]) for key in results[0]}
+    
+    phases, illuminations = columns['phases'], columns['illuminations']
+    supermoon_flags = columns['supermoon']
+    all_rise_times, all_set_times = columns['rise_times'], columns['set_times']
+    night_types, night_depths, night_times = (
+        columns['night_types'], columns['night_depths'], columns['night_times'])
+    found = pd.notna(night_times)
+    
+    # Calendar dates (Eastern) and rise/set strings, formatted in one pass each
+    dates = local_index.strftime('%Y-%m-%d').to_numpy()
+    rise_index = pd.DatetimeIndex([pd.NaT if t is None else t for t in all_rise_times], tz='UTC')
+    set_index = pd.DatetimeIndex([pd.NaT if t is None else t for t in all_set_times], tz='UTC')
+    rise_times = np.where(rise_index.isna(), "No rise", rise_index.strftime('%H:%M:%S UTC'))
+    set_times = np.where(set_index.isna(), "No set", set_index.strftime('%H:%M:%S UTC'))
+    
+    # Eclipses are reported on their own Eastern calendar date. Keep the
+    # deepest eclipse per date (earliest night on ties), then give every row
+    # the eclipse whose date matches its own, if any
+    eclipse_local = pd.DatetimeIndex(list(night_times[found]), tz='UTC').tz_convert(eastern)
+    eclipse_days = eclipse_local.tz_localize(None).normalize().to_numpy()
+    eclipse_depth_found = night_depths[found].astype(int)
+    order = np.lexsort((np.arange(len(eclipse_days)), -eclipse_depth_found, eclipse_days))
+    eclipse_days, first = np.unique(eclipse_days[order], return_index=True)
+    best = order[first]
+    
+    row_days = local_index.tz_localize(None).normalize().to_numpy()
+    pos = np.minimum(np.searchsorted(eclipse_days, row_days), max(len(eclipse_days) - 1, 0))
+    rows = np.flatnonzero(eclipse_days[pos] == row_days) if len(eclipse_days) else np.array([], dtype=int)
+    src = best[pos[rows]]
+    
+    # Eclipse columns default to "None"/0, scattered in for eclipse rows only
+    eclipse_types = np.full(total_days, "None", dtype=object)
+    eclipse_depths = np.zeros(total_days, dtype=np.int8)
+    eclipse_times = np.full(total_days, "None", dtype=object)
+    eclipse_types[rows] = night_types[found][src]
+    eclipse_depths[rows] = eclipse_depth_found[src]
+    eclipse_times[rows] = eclipse_local[src].strftime('%Y-%m-%d %H:%M ET')
+    # Create pandas DataFrame; Phase and Eclipse_Type have only a handful of
+    # values, so they are stored as categoricals
+    df = pd.DataFrame({
+        'Date': dates,
+        'Phase': pd.Categorical(phases, categories=PHASE_NAMES[:-1]),
+        'Illumination_%': illuminations,
+        'Moon_Rise': rise_times,
+        'Moon_Set': set_times,
+        'Up_All_Day': columns['up_all_day'],
+        'Down_All_Day': columns['down_all_day'],
+        'Eclipse_Type': pd.Categorical(eclipse_types, categories=ECLIPSE_TYPE_CATEGORIES),
+        'Eclipse_Depth_%': eclipse_depths,
+        'Eclipse_Time': eclipse_times,
+        'Supermoon': supermoon_flags
+    })
+    return df
+
+
+def load_or_generate_lunar_data(start_date, end_date):
+    """
+    Load the lunar data table from the Parquet cache, generating it if missing.
+    
+    The cache file is keyed by the date range, the ephemeris and the table
+    format version, so changing any of them triggers a fresh generation.
+    Code changes are only picked up through CACHE_FORMAT_VERSION, which must
+    be bumped whenever the generated values change.
+    
+    Args:
+        start_date: Timezone-aware datetime of the first evaluation instant
+        end_date: Timezone-aware datetime of the last evaluation instant
+    
+    Returns:
+        df: DataFrame with one row per day, as written to the CSV
+    """
+    cache_key = hashlib.sha1(
+        f"{start_date.isoformat()}|{end_date.isoformat()}|{EPHEMERIS_NAME}|{CACHE_FORMAT_VERSION}".encode()
+    ).hexdigest()[:16]
+    cache_filename = os.path.join(CACHE_DIR, f'lunar_data_{cache_key}.parquet')
+    if os.path.exists(cache_filename):
+        print(f"\nLoaded cached data from: {cache_filename}")
+        return pd.read_parquet(cache_filename)
+    
+    df = generate_lunar_data(start_date, end_date)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    df.to_parquet(cache_filename, compression='zstd', index=False)
+    return df
 
 
 def main():
@@ -217,87 +898,7 @@ def main():
     print(f"\nEnding at: {end_date.strftime('%Y-%m-%d %H:%M:%S')} Eastern Time")
     print(f"                 ({end_date_utc.strftime('%Y-%m-%d %H:%M:%S')} UTC)")
     print(f"\nGenerating data for {total_days} days (1900-2035)...")
-    # Initialize lists to store data
-    dates = []
-    phases = []
-    illuminations = []
-    rise_times = []
-    set_times = []
-    eclipse_types = []
-    eclipse_depths = []
-    eclipse_times = []
-    supermoon_flags = []
-    # Dictionary to store eclipses by their calendar date (Eastern time)
-    # Key: date string "YYYY-MM-DD", Value: (eclipse_type, depth, time_str)
-    eclipse_dict = {}
-    # Generate data for all days from 1900 to 2035
-    for day in range(total_days):
-        # Calculate the date for lunar phase (11PM Eastern)
-        date_utc = start_date_utc + timedelta(days=day)
-        date_local = date_utc.astimezone(eastern)
-        # Get lunar phase at 11PM Eastern
-        phase, illumination = get_lunar_phase(date_utc)
-        # --- SUPERMOON CHECK ---
-        # Compute geocentric distance at 11PM Eastern (UTC)
-        t = ts.utc(date_utc)
-        moon_apparent = earth.at(t).observe(moon).apparent()
-        distance_km = moon_apparent.distance().km  # Skyfield distance is in AU by default; .km gets km
-        # Supermoon definition: Full Moon and ≤360,000 km
-        is_supermoon = phase == "Full Moon" and distance_km <= 360000
-        supermoon_flags.append(is_supermoon)
-        # --- END SUPERMOON CHECK ---
-        # Get moon rise/set times for the calendar day
-        rise_time, set_time = get_moon_rise_set(date_utc)
-        # Check for lunar eclipse - sample hourly throughout the night if near full moon
-        eclipse_type, eclipse_depth, eclipse_time_utc = None, 0, None
-        if illumination > 85:  # Only check during near full moons
-            eclipse_type, eclipse_depth, eclipse_time_utc = sample_night_for_eclipse(
-                date_utc, rise_time, set_time
-            )
-            # Store eclipse info keyed by its actual calendar date (in Eastern time)
-            if eclipse_time_utc:
-                eclipse_local = eclipse_time_utc.astimezone(eastern)
-                eclipse_date = eclipse_local.strftime('%Y-%m-%d')
-                eclipse_time_str = eclipse_local.strftime('%Y-%m-%d %H:%M ET')
-                # Store in dictionary by actual date (keep the one with highest depth if multiple)
-                if eclipse_date not in eclipse_dict or eclipse_depth > eclipse_dict[eclipse_date][1]:
-                    eclipse_dict[eclipse_date] = (eclipse_type, eclipse_depth, eclipse_time_str)
-        # Format times for display
-        rise_str = "No rise" if rise_time is None else rise_time.strftime('%H:%M:%S UTC')
-        set_str = "No set" if set_time is None else set_time.strftime('%H:%M:%S UTC')
-        current_date = date_local.strftime('%Y-%m-%d')
-        # Store data
-        dates.append(current_date)
-        phases.append(phase)
-        illuminations.append(illumination)
-        rise_times.append(rise_str)
-        set_times.append(set_str)
-    # After all days, map eclipse info for each calendar date
-    for i, current_date in enumerate(dates):
-        if current_date in eclipse_dict:
-            eclipse_type, eclipse_depth, eclipse_time_str = eclipse_dict[current_date]
-            eclipse_types.append(eclipse_type)
-            eclipse_depths.append(eclipse_depth)
-            eclipse_times.append(eclipse_time_str)
-        else:
-            eclipse_types.append("None")
-            eclipse_depths.append(0)
-            eclipse_times.append("None")
-        # Progress indicator
-        if (i + 1) % 500 == 0:
-            print(f"  Generated data for {i + 1}/{total_days} days...")
-    # Create pandas DataFrame
-    df = pd.DataFrame({
-        'Date': dates,
-        'Phase': phases,
-        'Illumination_%': illuminations,
-        'Moon_Rise': rise_times,
-        'Moon_Set': set_times,
-        'Eclipse_Type': eclipse_types,
-        'Eclipse_Depth_%': eclipse_depths,
-        'Eclipse_Time': eclipse_times,
-        'Supermoon': supermoon_flags
-    })
+    df = load_or_generate_lunar_data(start_date, end_date)
     print("\nData generation complete!")
     print("\nFirst 10 rows:")
     print(df.head(10))
@@ -308,8 +909,14 @@ def main():
     if os.path.exists(csv_filename):
         os.remove(csv_filename)
         print(f"\nRemoved existing file: {csv_filename}")
-    df.to_csv(csv_filename, index=False)
+    df.to_csv(csv_filename, index=False, chunksize=8192)
     print(f"Data saved to: {csv_filename}")
+    # Typed Parquet copy read by the web app, rewritten from the same table
+    # so it never lags behind the CSV
+    parquet_filename = 'lunar_data_1900_2035.parquet'
+    df.assign(Date=pd.to_datetime(df['Date'])).to_parquet(parquet_filename, compression='zstd',
+                                                          index=False)
+    print(f"Data saved to: {parquet_filename}")
     print("=" * 60)
 
 if __name__ == "__main__":